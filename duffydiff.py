@@ -1,9 +1,252 @@
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
+from tkinter import ttk, filedialog, messagebox, simpledialog
 import difflib
 import os
+import sys
+import io
+import codecs
+import ctypes
+import ctypes.util
+import struct
+import subprocess
 from datetime import datetime
 
+# Bytes kept from the end of a watched file to tell appends from rewrites
+WATCH_TAIL_BYTES = 4096
+
+
+class GitBlobReader:
+    """Read blobs from a repository through one long-lived git cat-file process"""
+    def __init__(self, repo):
+        self.repo = repo
+        self.process = subprocess.Popen(["git", "-C", repo, "cat-file", "--batch"],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        
+    def is_alive(self):
+        """Whether the cat-file process is still running"""
+        return self.process.poll() is None
+        
+    def read(self, oid):
+        """Return the raw contents of a blob"""
+        try:
+            self.process.stdin.write(oid.encode("ascii") + b"\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            raise RuntimeError("git cat-file exited")
+            
+        # Header is "<oid> <type> <size>" or "<oid> missing", nothing if git exited
+        line = self.process.stdout.readline()
+        if not line:
+            raise RuntimeError("git cat-file exited")
+        header = line.split()
+        if len(header) != 3:
+            raise ValueError(f"Object not found: {oid}")
+            
+        size = int(header[2])
+        data = self.process.stdout.read(size)
+        if len(data) < size:
+            raise RuntimeError("git cat-file exited")
+        self.process.stdout.read(1)  # Trailing newline
+        return data
+        
+    def close(self):
+        """Stop the cat-file process"""
+        if self.process.poll() is None:
+            self.process.stdin.close()
+            self.process.wait()
+
+
+def git_merge_base(repo, first_ref, second_ref):
+    """Return the best common ancestor of two refs"""
+    cmd = ["git", "-C", repo, "merge-base", first_ref, second_ref]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        message = result.stderr.decode("utf-8", "replace").strip()
+        raise RuntimeError(message or f"No common ancestor of {first_ref} and {second_ref}")
+    return result.stdout.decode("ascii").strip()
+
+
+def git_changed_files(repo, old_ref, new_ref, path=None):
+    """List files whose blobs differ between two refs"""
+    cmd = ["git", "-C", repo, "diff-tree", "-r", "-z", "--full-index", old_ref, new_ref]
+    if path:
+        cmd += ["--", path]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.decode("utf-8", "replace").strip())
+        
+    # Each entry is ":<old mode> <new mode> <old oid> <new oid> <status>\0<path>\0"
+    fields = result.stdout.split(b"\0")
+    changes = []
+    for header, name in zip(fields[0::2], fields[1::2]):
+        old_mode, new_mode, old_oid, new_oid, status = header.decode("ascii").lstrip(":").split()
+        
+        # Mode-only changes share a blob, and submodules are commits, not blobs
+        if old_oid == new_oid or "160000" in (old_mode, new_mode):
+            continue
+            
+        changes.append({
+            'path': name.decode("utf-8", "replace"),
+            'old_oid': old_oid,
+            'new_oid': new_oid,
+            'status': status
+        })
+    return changes
+
+
+class FileWatcher:
+    """Report changed files, using inotify on Linux and polling elsewhere"""
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_Q_OVERFLOW = 0x4000
+    IN_NONBLOCK = 0o4000
+    WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    
+    def __init__(self, root, callback, interval=1000):
+        self.root = root
+        self.callback = callback
+        self.interval = interval
+        
+        self.paths = {}      # path -> last seen stat signature
+        self.watches = {}    # inotify watch descriptor -> directory
+        self.polled = set()  # paths inotify could not watch
+        self.changed = set()
+        self.flush_timer = None
+        self.poll_timer = None
+        
+        self.libc = None
+        self.fd = None
+        if sys.platform.startswith("linux"):
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+                fd = libc.inotify_init1(self.IN_NONBLOCK)
+                if fd >= 0:
+                    root.tk.createfilehandler(fd, tk.READABLE, self.on_inotify)
+                    self.libc = libc
+                    self.fd = fd
+            except (OSError, AttributeError, tk.TclError):
+                self.libc = None
+                
+        if self.fd is None:
+            self.poll()
+            
+    @staticmethod
+    def stat_signature(st):
+        """Identify a file version by inode, size and modification time"""
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+        
+    def signature(self, path):
+        """Signature of a file on disk, None if it cannot be read"""
+        try:
+            return self.stat_signature(os.stat(path))
+        except OSError:
+            return None
+            
+    def watch(self, path, signature=None):
+        """Start watching a file, changes are reported relative to signature"""
+        path = os.path.abspath(path)
+        self.paths[path] = signature if signature is not None else self.signature(path)
+        if self.fd is None:
+            return
+            
+        # Watch the directory so files replaced by rename are still seen
+        directory = os.path.dirname(path)
+        if directory not in self.watches.values():
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.WATCH_MASK)
+            if wd >= 0:
+                self.watches[wd] = directory
+            else:
+                # Out of watches or no permission, poll this file instead
+                self.polled.add(path)
+                if not self.poll_timer:
+                    self.poll_timer = self.root.after(self.interval, self.poll)
+                    
+    def unwatch(self, path):
+        """Stop watching a file"""
+        path = os.path.abspath(path)
+        self.paths.pop(path, None)
+        self.polled.discard(path)
+        
+        directory = os.path.dirname(path)
+        if self.fd is not None and not any(os.path.dirname(p) == directory for p in self.paths):
+            for wd, watched in list(self.watches.items()):
+                if watched == directory:
+                    self.libc.inotify_rm_watch(self.fd, wd)
+                    del self.watches[wd]
+                    
+    def on_inotify(self, fd, mask):
+        """Collect watched files named by pending inotify events"""
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except (BlockingIOError, InterruptedError):
+                break
+            if not data:
+                break
+                
+            # struct inotify_event: int wd; uint32 mask, cookie, len; char name[len]
+            pos = 0
+            while pos < len(data):
+                wd, event_mask, cookie, length = struct.unpack_from("iIII", data, pos)
+                pos += struct.calcsize("iIII")
+                name = data[pos:pos + length].rstrip(b"\0")
+                pos += length
+                
+                # Events were lost, any watched file may have changed
+                if event_mask & self.IN_Q_OVERFLOW:
+                    self.changed.update(self.paths)
+                elif wd in self.watches and name:
+                    path = os.path.join(self.watches[wd], os.fsdecode(name))
+                    if path in self.paths:
+                        self.changed.add(path)
+                        
+        # A busy writer produces many events, report them together
+        if self.changed and not self.flush_timer:
+            self.flush_timer = self.root.after(50, self.flush)
+            
+    def poll(self):
+        """Check watched files that notifications do not cover"""
+        self.changed.update(self.paths if self.fd is None else self.polled)
+        self.flush()
+        if self.fd is None or self.polled:
+            self.poll_timer = self.root.after(self.interval, self.poll)
+        else:
+            self.poll_timer = None
+        
+    def flush(self):
+        """Report files whose signature changed"""
+        self.flush_timer = None
+        changed, self.changed = self.changed, set()
+        
+        for path in changed:
+            if path not in self.paths:
+                continue
+            signature = self.signature(path)
+            if signature != self.paths[path]:
+                self.paths[path] = signature
+                if signature is not None:
+                    self.callback(path)
+                    
+    def close(self):
+        """Stop all watching"""
+        for timer in (self.flush_timer, self.poll_timer):
+            if timer:
+                self.root.after_cancel(timer)
+        self.flush_timer = self.poll_timer = None
+        
+        if self.fd is not None:
+            self.root.tk.deletefilehandler(self.fd)
+            os.close(self.fd)
+            self.fd = None
+        self.paths.clear()
+        self.polled.clear()
+        self.watches.clear()
+
+
 class ModernDiffApp:
     def __init__(self, root):
         self.root = root
@@ -21,10 +264,22 @@ class ModernDiffApp:
         self.left_file = None
         self.right_file = None
         
+        # Git comparison
+        self.git_reader = None
+        self.git_changes = []
+        self.git_refs = (None, None)
+        
+        # Watch mode
+        self.watch_mode = False
+        self.watcher = None
+        self.disk_state = {}
+        self.differs_from_disk = {'left': False, 'right': False}
+        
         # Differences
         self.differences = []
         self.current_diff = -1
         self.diff_widgets = []
+        self.compared_lines = None
         
         # History for undo
         self.history = []
@@ -36,6 +291,8 @@ class ModernDiffApp:
         self.create_statusbar()
         self.setup_bindings()
         
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
     def create_toolbar(self):
         """Create modern toolbar"""
         toolbar = tk.Frame(self.root, bg="#1e272e", height=45)
@@ -62,8 +319,19 @@ class ModernDiffApp:
         btn.pack(side=tk.LEFT, padx=3, pady=7)
         self.add_hover_effect(btn, "#0984e3", "#74b9ff")
         
+        btn = tk.Button(toolbar, text="🌿 Git Compare", command=self.open_git_compare,
+                       bg="#6c5ce7", fg="white", activebackground="#a29bfe", **button_style)
+        btn.pack(side=tk.LEFT, padx=3, pady=7)
+        self.add_hover_effect(btn, "#6c5ce7", "#a29bfe")
+        
+        # Changed files of the current git comparison (shown only in git mode)
+        self.git_file_combo = ttk.Combobox(toolbar, state="readonly", width=40)
+        self.git_file_combo.bind("<<ComboboxSelected>>",
+                                 lambda e: self.load_git_change(self.git_file_combo.current()))
+        
         # Separator
-        tk.Frame(toolbar, width=2, bg="#2d3436").pack(side=tk.LEFT, fill=tk.Y, padx=10)
+        self.compare_separator = tk.Frame(toolbar, width=2, bg="#2d3436")
+        self.compare_separator.pack(side=tk.LEFT, fill=tk.Y, padx=10)
         
         # Compare buttons
         btn = tk.Button(toolbar, text="🔍 Compare", command=self.compare,
@@ -78,6 +346,11 @@ class ModernDiffApp:
         self.auto_btn.pack(side=tk.LEFT, padx=3, pady=7)
         self.add_hover_effect(self.auto_btn, "#00b894" if self.auto_compare else "#636e72", "#55efc4")
         
+        self.watch_btn = tk.Button(toolbar, text="👁 Watch: OFF", command=self.toggle_watch_mode,
+                                  bg="#636e72", fg="white", activebackground="#95a5a6", **button_style)
+        self.watch_btn.pack(side=tk.LEFT, padx=3, pady=7)
+        self.add_hover_effect(self.watch_btn, "#636e72", "#95a5a6")
+        
         # Separator
         tk.Frame(toolbar, width=2, bg="#2d3436").pack(side=tk.LEFT, fill=tk.Y, padx=10)
         
@@ -227,6 +500,10 @@ class ModernDiffApp:
         self.left_text.bind("<KeyRelease>", lambda e: self.on_text_change())
         self.right_text.bind("<KeyRelease>", lambda e: self.on_text_change())
         
+        # Any edit, typed or done with the mouse, sets the modified flag
+        self.left_text.bind("<<Modified>>", lambda e: self.on_modified("left"))
+        self.right_text.bind("<<Modified>>", lambda e: self.on_modified("right"))
+        
     def sync_left_scroll(self, first, last):
         """Sync left scroll with others"""
         self.left_vscroll.set(first, last)
@@ -435,6 +712,40 @@ class ModernDiffApp:
             self.root.after_cancel(self.compare_timer)
             self.compare_timer = None
             
+    def toggle_watch_mode(self):
+        """Toggle reloading of the loaded files when they change on disk"""
+        self.watch_mode = not self.watch_mode
+        
+        if self.watch_mode:
+            self.watch_btn.config(text="👁 Watch: ON", bg="#00b894")
+            self.add_hover_effect(self.watch_btn, "#00b894", "#55efc4")
+            self.watcher = FileWatcher(self.root, self.on_file_changed)
+            mode = "notifications" if self.watcher.fd is not None else "polling"
+            status = f"Watch mode: enabled ({mode})"
+            
+            # Only files that changed since they were loaded need reading
+            changed = []
+            for side, state in self.disk_state.items():
+                self.watcher.watch(state['path'], state['signature'])
+                if self.watcher.signature(state['path']) != state['signature']:
+                    changed.append(side)
+            if changed:
+                status += " - " + self.reload_from_disk(changed, allow_append=True)
+        else:
+            self.watch_btn.config(text="👁 Watch: OFF", bg="#636e72")
+            self.add_hover_effect(self.watch_btn, "#636e72", "#95a5a6")
+            self.watcher.close()
+            self.watcher = None
+            status = "Watch mode: disabled"
+            
+        self.status_label.config(text=status)
+        
+    def on_modified(self, side):
+        """Note edits that make a panel differ from its file on disk"""
+        text_widget = self.left_text if side == "left" else self.right_text
+        if text_widget.edit_modified():
+            self.differs_from_disk[side] = True
+            
     def on_text_change(self):
         """Handle text changes"""
         self.update_line_numbers()
@@ -458,20 +769,17 @@ class ModernDiffApp:
         
         if filename:
             try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    
+                self.read_panel_from_disk(side, filename)
+                
                 if side == "left":
-                    self.left_text.delete(1.0, tk.END)
-                    self.left_text.insert(1.0, content)
                     self.left_file = filename
                     self.left_title.config(text=f"Left: {os.path.basename(filename)}")
                 else:
-                    self.right_text.delete(1.0, tk.END)
-                    self.right_text.insert(1.0, content)
                     self.right_file = filename
                     self.right_title.config(text=f"Right: {os.path.basename(filename)}")
                     
+                # A panel loaded from disk ends the git comparison
+                self.close_git_compare()
                 self.update_line_numbers()
                 self.status_label.config(text=f"Loaded: {os.path.basename(filename)}")
                 self.save_to_history()
@@ -482,6 +790,269 @@ class ModernDiffApp:
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load file: {str(e)}")
                 
+    def open_git_compare(self):
+        """Compare a path or a whole revision range between two git refs"""
+        repo = filedialog.askdirectory(title="Select git repository")
+        if not repo:
+            return
+            
+        rev_range = simpledialog.askstring("Git Compare", "Revision range (e.g. HEAD~1..HEAD):",
+                                           parent=self.root)
+        if not rev_range:
+            return
+            
+        path = simpledialog.askstring("Git Compare", "Path to compare (leave empty for all files):",
+                                      parent=self.root)
+        
+        # Same meaning as in git: "A..B" compares A with B, "A...B" compares the
+        # merge base of A and B with B, an omitted side defaults to HEAD, and a
+        # single ref is compared with HEAD
+        rev_range = rev_range.strip()
+        separator = "..." if "..." in rev_range else ".."
+        old_ref, found, new_ref = rev_range.partition(separator)
+        old_ref = old_ref.strip() or "HEAD"
+        new_ref = new_ref.strip() or "HEAD"
+        
+        try:
+            if found == "...":
+                base = git_merge_base(repo, old_ref, new_ref)
+                old_label = f"merge-base({old_ref}, {new_ref})"
+            else:
+                base = old_label = old_ref
+            changes = git_changed_files(repo, base, new_ref, path.strip() if path else None)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to compare revisions: {str(e)}")
+            return
+            
+        if not changes:
+            messagebox.showinfo("Git Compare", f"No differences between {old_label} and {new_ref}")
+            return
+            
+        # One cat-file process serves every blob of this comparison
+        if self.git_reader:
+            self.git_reader.close()
+        try:
+            self.git_reader = GitBlobReader(repo)
+        except Exception as e:
+            self.git_reader = None
+            messagebox.showerror("Error", f"Failed to start git: {str(e)}")
+            return
+            
+        self.git_changes = changes
+        self.git_refs = (old_label, new_ref)
+        
+        self.git_file_combo.config(values=[f"{c['status']} {c['path']}" for c in changes])
+        self.git_file_combo.pack(side=tk.LEFT, padx=3, pady=7, before=self.compare_separator)
+        self.load_git_change(0)
+        
+    def load_git_change(self, index):
+        """Load both versions of a changed file from the current git comparison"""
+        if not 0 <= index < len(self.git_changes):
+            return
+            
+        change = self.git_changes[index]
+        old_ref, new_ref = self.git_refs
+        
+        try:
+            left = self.read_git_blob(change['old_oid'])
+            right = self.read_git_blob(change['new_oid'])
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to read {change['path']}: {str(e)}")
+            return
+            
+        self.left_text.delete(1.0, tk.END)
+        self.left_text.insert(1.0, left)
+        self.left_file = None
+        self.left_title.config(text=f"Left: {change['path']} @ {old_ref}")
+        
+        self.right_text.delete(1.0, tk.END)
+        self.right_text.insert(1.0, right)
+        self.right_file = None
+        self.right_title.config(text=f"Right: {change['path']} @ {new_ref}")
+        
+        self.forget_disk_file("left")
+        self.forget_disk_file("right")
+        
+        self.git_file_combo.current(index)
+        self.current_diff = -1
+        
+        self.update_line_numbers()
+        self.save_to_history()
+        self.compare()
+        self.status_label.config(
+            text=f"File {index + 1} of {len(self.git_changes)}: {change['path']} - "
+                 f"{len(self.differences)} differences")
+        
+    def close_git_compare(self):
+        """Hide the changed-file list and stop the cat-file process"""
+        if self.git_reader:
+            self.git_reader.close()
+            self.git_reader = None
+        self.git_changes = []
+        self.git_refs = (None, None)
+        self.git_file_combo.pack_forget()
+        
+    def read_git_blob(self, oid):
+        """Read a blob as text, an all-zero id means the file does not exist"""
+        if set(oid) == {"0"}:
+            return ""
+            
+        # Restart cat-file if it exited since the last read
+        if not self.git_reader.is_alive():
+            self.git_reader = GitBlobReader(self.git_reader.repo)
+            
+        data = self.git_reader.read(oid)
+        if b"\0" in data:
+            return f"Binary file, not shown ({len(data)} bytes, {oid[:12]})\n"
+        return self.new_text_decoder().decode(data, final=True)
+        
+    def read_panel_from_disk(self, side, filename):
+        """Fill a panel from a file and remember that read for watch mode"""
+        text_widget = self.left_text if side == "left" else self.right_text
+        
+        with open(filename, 'rb') as f:
+            st = os.fstat(f.fileno())
+            data = f.read()
+        decoder = self.new_text_decoder()
+        content = decoder.decode(data)
+        
+        # Without a watch no more data follows, so flush a trailing partial
+        # character or CR; appends can then no longer continue this decode
+        if not self.watcher:
+            rest = decoder.decode(b"", final=True)
+            if rest:
+                content += rest
+                decoder = None
+                
+        text_widget.delete(1.0, tk.END)
+        text_widget.insert(1.0, content)
+        text_widget.edit_reset()
+        text_widget.edit_modified(False)
+        self.differs_from_disk[side] = False
+        self.compared_lines = None
+        
+        self.remember_disk_read(side, filename, st, data, decoder)
+        
+    def remember_disk_read(self, side, filename, st, data, decoder):
+        """Record the read that filled a panel, watch the file in watch mode"""
+        path = os.path.abspath(filename)
+        self.forget_disk_file(side, keep=path)
+        
+        self.disk_state[side] = {
+            'path': path,
+            'signature': FileWatcher.stat_signature(st),
+            'inode': st.st_ino,
+            'offset': len(data),
+            'tail': data[-WATCH_TAIL_BYTES:],
+            'decoder': decoder
+        }
+        if self.watcher:
+            self.watcher.watch(path, self.disk_state[side]['signature'])
+            
+    def forget_disk_file(self, side, keep=None):
+        """Drop the disk state of a panel, unwatching the file unless still shown"""
+        old = self.disk_state.pop(side, None)
+        if (self.watcher and old and old['path'] != keep and
+                all(state['path'] != old['path'] for state in self.disk_state.values())):
+            self.watcher.unwatch(old['path'])
+            
+    @staticmethod
+    def new_text_decoder():
+        """UTF-8 decoder translating CRLF, also across incremental reads"""
+        return io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")("replace"), translate=True)
+        
+    def on_file_changed(self, path):
+        """Reload a watched file and update the comparison"""
+        sides = [side for side, state in self.disk_state.items() if state['path'] == path]
+        if sides:
+            self.status_label.config(text=self.reload_from_disk(sides, allow_append=True))
+            
+    def reload_from_disk(self, sides, allow_append):
+        """Bring panels up to date with their files, return a status message"""
+        # The diff can only be extended if the panels still hold what was compared
+        can_extend = (self.compared_lines is not None and
+                      not self.left_text.edit_modified() and
+                      not self.right_text.edit_modified())
+        view = (self.left_text.index("@0,0"), self.right_text.index("@0,0"))
+        
+        # Edited panels are replaced below, keep their text one undo step away
+        edited = [side for side in sides if self.differs_from_disk[side]]
+        if edited:
+            self.save_to_history()
+            
+        appended = True
+        reloaded = []
+        errors = []
+        for side in sides:
+            filename = self.disk_state[side]['path']
+            try:
+                if not (allow_append and self.append_watched_file(side)):
+                    appended = False
+                    self.read_panel_from_disk(side, filename)
+                reloaded.append(side)
+            except OSError as e:
+                errors.append(f"cannot reload {os.path.basename(filename)}: {str(e)}")
+                
+        if reloaded:
+            if can_extend and appended:
+                self.extend_compare()
+            else:
+                self.compare()
+            self.save_to_history()
+            
+            # Keep the scroll position and the selected difference
+            self.is_syncing = True
+            self.left_text.yview(view[0])
+            self.right_text.yview(view[1])
+            self.is_syncing = False
+            self.highlight_current_diff()
+            self.update_line_numbers()
+            self.update_middle_panel()
+            
+        messages = []
+        if reloaded:
+            names = ", ".join(os.path.basename(self.disk_state[side]['path']) for side in reloaded)
+            action = "Appended to" if appended else "Reloaded"
+            messages.append(f"{action} {names}: {len(self.differences)} differences")
+            replaced = [side for side in reloaded if side in edited]
+            if replaced:
+                messages.append(f"edits in the {' and '.join(replaced)} panel replaced, Undo restores them")
+        messages += errors
+        return " - ".join(messages)
+        
+    def append_watched_file(self, side):
+        """Add the new tail of a grown file to its panel, False if it was not an append"""
+        state = self.disk_state.get(side)
+        if not state or state['decoder'] is None or self.differs_from_disk[side]:
+            return False
+            
+        text_widget = self.left_text if side == "left" else self.right_text
+        with open(state['path'], 'rb') as f:
+            st = os.fstat(f.fileno())
+            tail_len = len(state['tail'])
+            
+            # Same file, grown, and the bytes before the old end are unchanged
+            if st.st_ino != state['inode'] or st.st_size <= state['offset']:
+                return False
+            f.seek(state['offset'] - tail_len)
+            if f.read(tail_len) != state['tail']:
+                return False
+            data = f.read()
+            
+        text_widget.insert("end-1c", state['decoder'].decode(data))
+        text_widget.edit_reset()
+        state['offset'] += len(data)
+        state['tail'] = (state['tail'] + data)[-WATCH_TAIL_BYTES:]
+        state['signature'] = FileWatcher.stat_signature(st)
+        return True
+        
+    def on_close(self):
+        """Release background resources and close the window"""
+        self.close_git_compare()
+        if self.watcher:
+            self.watcher.close()
+        self.root.destroy()
+                
     def compare(self):
         """Compare the two texts"""
         left_lines = self.left_text.get(1.0, "end-1c").splitlines()
@@ -494,34 +1065,83 @@ class ModernDiffApp:
         
         # Get differences
         differ = difflib.SequenceMatcher(None, left_lines, right_lines)
-        
-        for tag, i1, i2, j1, j2 in differ.get_opcodes():
-            if tag != 'equal':
-                self.differences.append({
-                    'type': tag,
-                    'left_start': i1 + 1,
-                    'left_end': i2,
-                    'right_start': j1 + 1,
-                    'right_end': j2
-                })
-                
-                # Highlight differences
-                if tag == 'delete':
-                    for i in range(i1, i2):
-                        self.left_text.tag_add("removed", f"{i+1}.0", f"{i+1}.end")
-                elif tag == 'insert':
-                    for j in range(j1, j2):
-                        self.right_text.tag_add("added", f"{j+1}.0", f"{j+1}.end")
-                elif tag == 'replace':
-                    for i in range(i1, i2):
-                        self.left_text.tag_add("modified", f"{i+1}.0", f"{i+1}.end")
-                    for j in range(j1, j2):
-                        self.right_text.tag_add("modified", f"{j+1}.0", f"{j+1}.end")
+        self.add_differences(differ.get_opcodes())
+        self.mark_compared(left_lines, right_lines)
         
         # Update middle panel
         self.update_middle_panel()
+        self.update_compare_status()
         
-        # Update status
+    def extend_compare(self):
+        """Compare only the tail of both texts after lines were appended"""
+        left_lines = self.left_text.get(1.0, "end-1c").splitlines()
+        right_lines = self.right_text.get(1.0, "end-1c").splitlines()
+        old_left, old_right = self.compared_lines
+        
+        # The append may have completed the old last line of either side, so drop
+        # differences reaching past it and restart from a common line before it
+        left_start, right_start = max(old_left - 1, 0), max(old_right - 1, 0)
+        while self.differences and (self.differences[-1]['left_end'] > left_start or
+                                    self.differences[-1]['right_end'] > right_start):
+            last = self.differences.pop()
+            left_start = min(left_start, last['left_start'] - 1)
+            right_start = min(right_start, last['right_start'] - 1)
+            
+        if self.differences:
+            prev_left, prev_right = self.differences[-1]['left_end'], self.differences[-1]['right_end']
+        else:
+            prev_left, prev_right = 0, 0
+        common = min(left_start - prev_left, right_start - prev_right)
+        left_start, right_start = prev_left + common, prev_right + common
+            
+        for tag in ["added", "removed", "modified"]:
+            self.left_text.tag_remove(tag, f"{left_start + 1}.0", tk.END)
+            self.right_text.tag_remove(tag, f"{right_start + 1}.0", tk.END)
+            
+        differ = difflib.SequenceMatcher(None, left_lines[left_start:], right_lines[right_start:])
+        self.add_differences(differ.get_opcodes(), left_start, right_start)
+        self.mark_compared(left_lines, right_lines)
+        
+        self.update_middle_panel()
+        self.update_compare_status()
+        
+    def add_differences(self, opcodes, left_offset=0, right_offset=0):
+        """Record and highlight the non-equal opcodes of a comparison"""
+        for tag, i1, i2, j1, j2 in opcodes:
+            if tag == 'equal':
+                continue
+                
+            i1, i2 = i1 + left_offset, i2 + left_offset
+            j1, j2 = j1 + right_offset, j2 + right_offset
+            self.differences.append({
+                'type': tag,
+                'left_start': i1 + 1,
+                'left_end': i2,
+                'right_start': j1 + 1,
+                'right_end': j2
+            })
+            
+            # Highlight differences
+            if tag == 'delete':
+                for i in range(i1, i2):
+                    self.left_text.tag_add("removed", f"{i+1}.0", f"{i+1}.end")
+            elif tag == 'insert':
+                for j in range(j1, j2):
+                    self.right_text.tag_add("added", f"{j+1}.0", f"{j+1}.end")
+            elif tag == 'replace':
+                for i in range(i1, i2):
+                    self.left_text.tag_add("modified", f"{i+1}.0", f"{i+1}.end")
+                for j in range(j1, j2):
+                    self.right_text.tag_add("modified", f"{j+1}.0", f"{j+1}.end")
+                    
+    def mark_compared(self, left_lines, right_lines):
+        """Remember what was compared so later appends can extend the result"""
+        self.compared_lines = (len(left_lines), len(right_lines))
+        self.left_text.edit_modified(False)
+        self.right_text.edit_modified(False)
+        
+    def update_compare_status(self):
+        """Show the result of the last comparison"""
         if self.differences:
             self.info_label.config(text=f"🔍 {len(self.differences)} differences found")
             self.status_label.config(text=f"Comparison complete: {len(self.differences)} differences")
@@ -534,6 +1154,7 @@ class ModernDiffApp:
     def copy_diff(self, diff, direction):
         """Copy difference from one side to another"""
         self.save_to_history()
+        self.differs_from_disk[direction] = True
         
         try:
             if direction == "right":
@@ -620,6 +1241,7 @@ class ModernDiffApp:
             self.left_text.insert(1.0, state['left'])
             self.right_text.delete(1.0, tk.END)
             self.right_text.insert(1.0, state['right'])
+            self.differs_from_disk = {'left': True, 'right': True}
             
             self.update_line_numbers()
             self.status_label.config(text="Undo performed")
@@ -639,21 +1261,27 @@ class ModernDiffApp:
             self.current_diff = index
             diff = self.differences[index]
             
-            # Clear current highlights
-            self.left_text.tag_remove("current", 1.0, tk.END)
-            self.right_text.tag_remove("current", 1.0, tk.END)
-            
             # Highlight and scroll to difference
+            self.highlight_current_diff()
             if diff['left_end'] >= diff['left_start']:
                 self.left_text.see(f"{diff['left_start']}.0")
-                self.left_text.tag_add("current", f"{diff['left_start']}.0", f"{diff['left_end'] + 1}.0")
-                
             if diff['right_end'] >= diff['right_start']:
                 self.right_text.see(f"{diff['right_start']}.0")
-                self.right_text.tag_add("current", f"{diff['right_start']}.0", f"{diff['right_end'] + 1}.0")
                 
             self.status_label.config(text=f"Viewing difference {index + 1} of {len(self.differences)}")
             
+    def highlight_current_diff(self):
+        """Highlight the selected difference without scrolling"""
+        self.left_text.tag_remove("current", 1.0, tk.END)
+        self.right_text.tag_remove("current", 1.0, tk.END)
+        
+        if 0 <= self.current_diff < len(self.differences):
+            diff = self.differences[self.current_diff]
+            if diff['left_end'] >= diff['left_start']:
+                self.left_text.tag_add("current", f"{diff['left_start']}.0", f"{diff['left_end'] + 1}.0")
+            if diff['right_end'] >= diff['right_start']:
+                self.right_text.tag_add("current", f"{diff['right_start']}.0", f"{diff['right_end'] + 1}.0")
+                
     def next_diff(self):
         """Go to next difference"""
         if self.differences: